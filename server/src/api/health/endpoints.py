@@ -1,13 +1,42 @@
-from fastapi import APIRouter, status
+import time
+from datetime import datetime, timezone
+
+import orjson
+from fastapi import APIRouter, Response, status
 from loguru import logger
 
-from core.settings import settings
 from core.utils.responses import EnvelopeResponse
 
 router = APIRouter(tags=["Health Check"])
 
 router = APIRouter()
 
+HEALTH_MESSAGE = "The service is online and functioning properly."
+
+# (epoch second, serialized payload); the body is rebuilt at most once per second.
+_last_health_body: tuple[int, bytes] = (0, b"")
+
+
+def _get_health_body() -> bytes:
+    global _last_health_body  # noqa: PLW0603
+    now = int(time.time())
+    if _last_health_body[0] != now:
+        body = orjson.dumps(
+            {
+                "errors": None,
+                "message": HEALTH_MESSAGE,
+                "status_code": status.HTTP_200_OK,
+                "successful": True,
+                "body": {
+                    "status": "ok",
+                    "message": HEALTH_MESSAGE,
+                    "timestamp": datetime.fromtimestamp(now, timezone.utc).isoformat(),
+                },
+            }
+        )
+        _last_health_body = (now, body)
+    return _last_health_body[1]
+
 
 @router.get(
     "/health",
@@ -15,17 +44,6 @@ router = APIRouter()
     summary="Health service",
     response_model=EnvelopeResponse,
 )
-def health_check() -> EnvelopeResponse:
+def health_check() -> Response:
     logger.info("Health")
-    result = {
-        "status": "ok",
-        "message": "The service is online and functioning properly.",
-        "timestamp": settings.TIMESTAP,
-    }
-    return EnvelopeResponse(
-        errors=None,
-        body=result,
-        status_code=status.HTTP_200_OK,
-        successful=True,
-        message="The service is online and functioning properly.",
-    )
+    return Response(content=_get_health_body(), media_type="application/json")
@@ -1,48 +1,93 @@
-from fastapi import HTTPException, Request, status
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import HTTPException, status
+from loguru import logger
 from psycopg2.errors import ForeignKeyViolation
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm.exc import NoResultFound
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from core.utils.exceptions import BaseAppException
 from core.utils.responses import EnvelopeResponse
 
 
-class CatcherExceptionsMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app):
-        super().__init__(app)
+def _handle_http_exception(e: HTTPException):
+    return {"detail": str(e.detail)}, e.status_code, str(e)
+
+
+def _handle_no_result_found(e: NoResultFound):
+    return {"detail": f"No found: {e}"}, status.HTTP_404_NOT_FOUND, str(e)
+
+
+def _handle_integrity_error(e: IntegrityError):
+    err = e.orig
+    if isinstance(err, ForeignKeyViolation):
+        message = f"ForeignKeyViolation: {err.diag.table_name}"
+        return {f"{err.diag.table_name}": message}, status.HTTP_409_CONFLICT, message
+    return err, status.HTTP_500_INTERNAL_SERVER_ERROR, str(e)
+
+
+def _handle_app_exception(e: BaseAppException):
+    error_detail = e.to_dict()
+    logger.log(e.log_level, "{}: {}", type(e).__name__, error_detail)
+    return error_detail, e.status_code, str(e)
+
+
+_HANDLERS = {
+    HTTPException: _handle_http_exception,
+    NoResultFound: _handle_no_result_found,
+    IntegrityError: _handle_integrity_error,
+    BaseAppException: _handle_app_exception,
+}
+
+
+class CatcherExceptionsMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
 
-    async def dispatch(self, request: Request, call_next):
         try:
-            return await call_next(request)
-        except Exception as e:  # noqa: BLE001
-            if isinstance(e, HTTPException):
-                error_detail = {"detail": str(e.detail)}
-                status_code = e.status_code
-            if isinstance(e, NoResultFound):
-                error_detail = {"detail": f"No found: {e}"}
-                status_code = status.HTTP_404_NOT_FOUND
-            elif isinstance(e, IntegrityError):
-                error_detail = e.orig
-                status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
-                if isinstance(e.orig, ForeignKeyViolation):
-                    err = e.orig
-                    error_detail = {f"{err.diag.table_name}": f"ForeignKeyViolation: {err.diag.table_name}"}
-                    status_code = status.HTTP_409_CONFLICT
-                    e = f"ForeignKeyViolation: {err.diag.table_name}"
-            elif isinstance(e, BaseAppException):
-                error_detail = e.to_dict()
-                status_code = e.status_code
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            if response_started:
+                raise
+
+            for exc_type, handler in _HANDLERS.items():
+                if isinstance(e, exc_type):
+                    error_detail, status_code, message = handler(e)
+                    break
             else:
                 error_detail = {"detail": str(e)}
                 status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+                message = str(e)
 
             response = EnvelopeResponse(
                 errors=error_detail,
                 body=None,
-                message=str(e),
+                message=message,
                 status_code=status_code,
                 successful=False,
             )
-            return JSONResponse(status_code=status_code, content=dict(response))
+            content = orjson.dumps(response.model_dump(), default=str)
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": status_code,
+                    "headers": [
+                        (b"content-type", b"application/json"),
+                        (b"content-length", str(len(content)).encode("latin-1")),
+                    ],
+                }
+            )
+            await send({"type": "http.response.body", "body": content})
@@ -1,18 +1,37 @@
-import uuid
+from os import urandom
 
 from loguru import logger
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 
-class LoggerMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        trace_id = request.headers.get("x-trace-id", str(uuid.uuid4()))
-        caller_id = request.headers.get("x-caller-id", "000000")
+class LoggerMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-        logger.info(f"Received request {request.method} {request.url}")
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        trace_id = None
+        caller_id = None
+        for key, value in scope["headers"]:
+            if key == b"x-trace-id":
+                trace_id = value.decode("latin-1")
+            elif key == b"x-caller-id":
+                caller_id = value.decode("latin-1")
+            else:
+                continue
+            if trace_id is not None and caller_id is not None:
+                break
+
+        trace_id = trace_id or urandom(8).hex()
+        caller_id = caller_id or "000000"
+
+        raw_path = scope.get("raw_path")
+        path = raw_path.decode("latin-1") if raw_path else scope["path"]
+        logger.info("Received request {} {}", scope["method"], path)
 
         with logger.contextualize(trace_id=trace_id, caller_id=caller_id):
-            response = await call_next(request)
+            await self.app(scope, receive, send)
             logger.info("Request ended")
-            return response
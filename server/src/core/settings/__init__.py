@@ -44,9 +44,13 @@ log = logging.getLogger(__name__)
 settings: Settings = Settings()
 
 
-if settings.ENVIRONMENT in [EnvironmentsTypes.PRODUCTION.value[0], EnvironmentsTypes.STAGING.value[0]]:
+_SENTRY_ENVIRONMENTS = frozenset((EnvironmentsTypes.PRODUCTION.value[0], EnvironmentsTypes.STAGING.value[0]))
+
+# Skip init when a client is already bound, e.g. when settings are reloaded.
+if settings.ENVIRONMENT in _SENTRY_ENVIRONMENTS and sentry_sdk.Hub.current.client is None:
     sentry_sdk.init(
         dsn=settings.SENTRY_DSN,
         environment=settings.ENVIRONMENT,
         traces_sample_rate=0,
+        include_local_variables=False,
     )
@@ -1,7 +1,6 @@
 # Standard Library
 import os
 import sys
-from datetime import datetime
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -33,6 +32,9 @@ class Settings(PydanticBaseSettings):
     # Database settings
     # ----------------------------------------------------------------
     POSTGRESQL_URL: PostgresDsn
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800
 
     # Project Constants
     # ----------------------------------------------------------------
@@ -45,11 +47,15 @@ class Settings(PydanticBaseSettings):
     DATE_TIME_FORMAT: str = "%Y-%m-%d %H:%M:%S"
     API_V1: str = "v1"
 
+    # Logging settings
+    # ----------------------------------------------------------------
+    LOG_ENQUEUE: bool = False
+
     # Pagination settings
     # ----------------------------------------------------------------
     DEFAULT_PAGE_SIZE: int = 30
     DEFAULT_ORDER_FIELD: str = "created"
-
-    TIMESTAP: datetime = datetime.now().astimezone().strftime(format=DATE_TIME_FORMAT)
+    MAX_LIST_SIZE: int = 10000
+    LIST_BATCH_SIZE: int = 1000
 
 
@@ -1,9 +1,9 @@
 from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
 
 import sentry_sdk
-from sqlalchemy import create_engine, select, text
+from sqlalchemy import create_engine, select
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import NullPool
 
 from core.settings import log, settings
 from core.utils.exceptions import BaseAppException
@@ -12,48 +12,54 @@ from models.base_model import Base as BaseModel
 
 engine = create_engine(
     settings.POSTGRESQL_URL.unicode_string(),
-    poolclass=NullPool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=True,
     connect_args={"application_name": "fee-api-service"},
 )
 Session = sessionmaker(bind=engine, autocommit=False)  # noqa: F811
 
+_sentry_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sentry")
+
+
+def _capture_exception(exc: BaseException):
+    # Serializing the event happens on a worker thread with a copy of the current hub,
+    # so the request is not held up by Sentry and keeps its scope data.
+    hub = sentry_sdk.Hub(sentry_sdk.Hub.current)
+    _sentry_executor.submit(hub.capture_exception, exc)
+
 
 def get_session() -> Generator:
-    log.info("Getting db session")
     db = Session()
-    log.info("DB session has been stablished")
     try:
         yield db
     except Exception as exc:  # noqa: BLE001
         db.rollback()
-        sentry_sdk.capture_exception(exc)
-        log.info(exc)
+        _capture_exception(exc)
     finally:
         db.close()
 
 
 def create_schemas():
-    schema_format = "CREATE SCHEMA IF NOT EXISTS {}"
-    query_schema_public = text(schema_format.format("public"))
-    query_schema_auth = text(schema_format.format("core"))
-
-    with engine.connect() as conn:
-        with conn.begin():
-            conn.execute(query_schema_public)
-            conn.execute(query_schema_auth)
-
+    schemas = ("public", "core")
+    query_schemas = " ".join(f"CREATE SCHEMA IF NOT EXISTS {schema};" for schema in schemas)
 
-        conn.close()
+    with engine.begin() as conn:
+        conn.exec_driver_sql(query_schemas)
 
 
 class DatabaseSessionMixin:
     """Database session mixin."""
 
     def __enter__(self) -> Session:  # type: ignore  # noqa: PGH003
-        self.session = next(get_session())
+        self.session = Session()
         return self.session
 
     def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is not None:
+            self.session.rollback()
+            _capture_exception(exc_val)
         self.session.close()
 
 
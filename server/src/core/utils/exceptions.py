@@ -1,21 +1,17 @@
-import logging
-
 from fastapi import status
 from sqlalchemy.orm.exc import NoResultFound
 
-logger = logging.getLogger(__name__)
-
 
 class BaseAppException(Exception):  # noqa: N818
     error_key = None  # Class variable that can be overwritten by subclasses
     status_code = status.HTTP_400_BAD_REQUEST
+    log_level = "WARNING"  # Level the exception middleware logs it with
 
     def __init__(self, message):
         super().__init__(message)
         # If error_key isn't defined, use the class name
         self.error_name = self.error_key or self.__class__.__name__
         self.message = message
-        logger.warning(self.to_dict().__str__())
 
     def to_dict(self):
         return {self.error_name: str(self.message)}
@@ -28,7 +24,6 @@ class ObjectNotFound(NoResultFound):
     def __init__(self, message, data=None):
         super().__init__(message)
         self.data = data if data is not None else {}
-        logger.warning(self.__class__.__str__())
 
 
 class FormException(BaseAppException):
@@ -37,7 +32,6 @@ class FormException(BaseAppException):
 
     def __init__(self, field_errors: dict | None = None) -> None:
         self.field_errors = field_errors or {}
-        logger.warning(self.to_dict().__str__())
 
     def to_dict(self):
         return {error: value for error, value in self.field_errors.items() if value}
@@ -50,12 +44,25 @@ class FilterException(BaseAppException):
     def __init__(self, invalid_keys: list | None = None, valid_keys: list | None = None) -> None:
         self.invalid_keys = invalid_keys
         self.valid_keys = valid_keys
-        logger.warning(self.to_dict().__str__())
 
     def to_dict(self):
         return {value: f"Choose one of {self.valid_keys}" for value in self.invalid_keys}
 
 
+class CursorException(BaseAppException):
+    error_key = "CursorError"
+    status_code = status.HTTP_400_BAD_REQUEST
+
+    def __init__(self, cursor: str | None = None) -> None:
+        self.cursor = cursor
+
+    def to_dict(self):
+        return {"cursor": f"Invalid pagination cursor {self.cursor}"}
+
+    def __str__(self):
+        return f"Invalid pagination cursor {self.cursor}"
+
+
 class NotFoundObjectException(BaseAppException):
     error_key = "NotFoundObjectError"
     status_code = status.HTTP_404_NOT_FOUND
@@ -74,7 +81,6 @@ class NotFoundContractException(BaseAppException):
 
     def __init__(self, id: str | None = None) -> None:
         self.id = id
-        logger.warning(self.to_dict().__str__())
 
     def to_dict(self):
         return {"contract_id": f"Contract Not Found with id {self.id}"}
@@ -104,11 +110,11 @@ class FeeAlreadyExistsException(BaseAppException):
 class NotAuthorizationException(BaseAppException):
     error_key = "NotAuthorization"
     status_code = status.HTTP_401_UNAUTHORIZED
+    log_level = "ERROR"
 
     def __init__(self, message: str = "Not autorization", resource: str | None = None) -> None:
         self.resource = resource
         self.message = f"{message} to resorce {resource}"
-        logger.error(self.message)
 
     def to_dict(self):
         return {"endpoint": f"Dont autorization to resource {self.resource}"}
@@ -120,10 +126,10 @@ class NotAuthorizationException(BaseAppException):
 class EncryptedException(BaseAppException):
     error_key = "Encrypted"
     status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+    log_level = "ERROR"
 
     def __init__(self, message: str = "Not encrypted exception") -> None:
         self.message = message
-        logger.error(self.message)
 
     def to_dict(self):
         return {"encrypted": self.message}
@@ -135,10 +141,10 @@ class EncryptedException(BaseAppException):
 class ServiceNameException(BaseAppException):
     error_key = "ServiceName"
     status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+    log_level = "ERROR"
 
     def __init__(self, message: str = "The service name is already in use") -> None:
         self.message = message
-        logger.error(self.message)
 
     def to_dict(self):
         return {"service_name": self.message}
@@ -150,10 +156,10 @@ class ServiceNameException(BaseAppException):
 class EmailUniqueException(BaseAppException):
     error_key = "EmailUnique"
     status_code = status.HTTP_409_CONFLICT
+    log_level = "ERROR"
 
     def __init__(self, message: str = "There is already a registered user with the email: ", email: str = "") -> None:
         self.message = f"{message} {email}"
-        logger.error(self.message)
 
     def to_dict(self):
         return {"email": self.message}
@@ -165,12 +171,12 @@ class EmailUniqueException(BaseAppException):
 class UserNameUniqueException(BaseAppException):
     error_key = "EmailUnique"
     status_code = status.HTTP_409_CONFLICT
+    log_level = "ERROR"
 
     def __init__(
         self, message: str = "There is already a registered user with the user_name: ", user_name: str = ""
     ) -> None:
         self.message = f"{message} {user_name}"
-        logger.error(self.message)
 
     def to_dict(self):
         return {"email": self.message}
@@ -182,10 +188,10 @@ class UserNameUniqueException(BaseAppException):
 class DontFindResourceException(BaseAppException):
     error_key = "DontFindResoruce"
     status_code = status.HTTP_404_NOT_FOUND
+    log_level = "ERROR"
 
     def __init__(self, message: str = "The resource dont find: ", resource: str = "") -> None:
         self.message = f"{message} {resource}"
-        logger.error(self.message)
 
     def to_dict(self):
         return {"resource": self.message}
@@ -197,10 +203,10 @@ class DontFindResourceException(BaseAppException):
 class DontValidCodeException(BaseAppException):
     error_key = "DontValidCode"
     status_code = status.HTTP_404_NOT_FOUND
+    log_level = "ERROR"
 
     def __init__(self, message: str = "The code is dont valid ", code: str = "", user_name: str = "") -> None:
         self.message = f"{message} code :{code} user_name: {user_name}"
-        logger.error(self.message)
 
     def to_dict(self):
         return {"resource": self.message}
@@ -212,10 +218,10 @@ class DontValidCodeException(BaseAppException):
 class CodeAlreadyExpiredException(BaseAppException):
     error_key = "CodeAlreadyExpired"
     status_code = status.HTTP_404_NOT_FOUND
+    log_level = "ERROR"
 
     def __init__(self, message: str = "The code has already expired") -> None:
         self.message = message
-        logger.error(self.message)
 
     def to_dict(self):
         return {"resource": self.message}
@@ -227,10 +233,10 @@ class CodeAlreadyExpiredException(BaseAppException):
 class CodeAlreadyUseException(BaseAppException):
     error_key = "CodeAlreadyUse"
     status_code = status.HTTP_404_NOT_FOUND
+    log_level = "ERROR"
 
     def __init__(self, message: str = "The code has already used ", code: str = "", user_name: str = "") -> None:
         self.message = f"{message} code :{code} user_name: {user_name}"
-        logger.error(self.message)
 
     def to_dict(self):
         return {"resource": self.message}
@@ -242,10 +248,10 @@ class CodeAlreadyUseException(BaseAppException):
 class PasswordNoneException(BaseAppException):
     error_key = "PasswordNone"
     status_code = status.HTTP_409_CONFLICT
+    log_level = "ERROR"
 
     def __init__(self, message: str = "The password cannot be None") -> None:
         self.message = message
-        logger.error(self.message)
 
     def to_dict(self):
         return {"password": self.message}
@@ -257,10 +263,10 @@ class PasswordNoneException(BaseAppException):
 class PasswordNotValidException(BaseAppException):
     error_key = "PasswordNotValid"
     status_code = status.HTTP_400_BAD_REQUEST
+    log_level = "ERROR"
 
     def __init__(self, message: str = "The password must have [A-Za-z0-9 &%$*?¿¡!]") -> None:
         self.message = message
-        logger.error(self.message)
 
     def to_dict(self):
         return {"password": self.message}
@@ -272,10 +278,10 @@ class PasswordNotValidException(BaseAppException):
 class AccountUnverifiedException(BaseAppException):
     error_key = "AccountUnverified"
     status_code = status.HTTP_400_BAD_REQUEST
+    log_level = "ERROR"
 
     def __init__(self, message: str = "The unverified account") -> None:
         self.message = message
-        logger.error(self.message)
 
     def to_dict(self):
         return {"account": self.message}
@@ -286,10 +292,10 @@ class AccountUnverifiedException(BaseAppException):
 class UserNameAndEmailIsEmptyException(BaseAppException):
     error_key = "UserNameAndEmailIsEmpty"
     status_code = status.HTTP_400_BAD_REQUEST
+    log_level = "ERROR"
 
     def __init__(self, message: str = "The user_name and email is empty") -> None:
         self.message = message
-        logger.error(self.message)
 
     def to_dict(self):
         return {"account": self.message}
@@ -302,10 +308,10 @@ class UserNameAndEmailIsEmptyException(BaseAppException):
 class StepSAGAException(BaseAppException):
     error_key = "StepSAGA"
     status_code = status.HTTP_409_CONFLICT
+    log_level = "ERROR"
 
     def __init__(self, message: str = "Error in Step") -> None:
         self.message = f"{message}"
-        logger.error(self.message)
 
     def to_dict(self):
         return {"step": self.message}
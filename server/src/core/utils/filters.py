@@ -1,7 +1,14 @@
+from functools import cache
+
 from core.settings import settings
 from core.utils.exceptions import FilterException
 
 
+@cache
+def _valid_keys(model) -> frozenset:
+    return frozenset(model.__table__.columns.keys())
+
+
 class ManagerFilter:
     separator = "__"
 
@@ -16,10 +23,10 @@ class ManagerFilter:
         ordering = [settings.DEFAULT_ORDER_FIELD]
 
         for key, value in filters.items():
-            if self.separator in key:
-                range_filters.update({key: value})
-            elif key == "ordering":
+            if key == "ordering":
                 ordering = value.split(",") if "," in value else [value]
+            elif self.separator in key:
+                range_filters.update({key: value})
             else:
                 single_filters.update({key: value})
         return single_filters, range_filters, ordering
@@ -27,10 +34,10 @@ class ManagerFilter:
     def clean_order_by_keys(self, ordering_keys: list) -> list:
         cleaned_data = []
         invalid_keys = []
-        valid_keys = self.model.__table__.columns.keys()
+        valid_keys = _valid_keys(self.model)
 
         for key in ordering_keys:
-            clean_key = key.replace("-", "", 1)
+            clean_key = key[1:] if key[:1] == "-" else key
             if not clean_key:
                 continue
             if clean_key in valid_keys:
@@ -39,7 +46,7 @@ class ManagerFilter:
                 invalid_keys.append(key)
 
         if invalid_keys:
-            raise FilterException(invalid_keys=invalid_keys, valid_keys=valid_keys)
+            raise FilterException(invalid_keys=invalid_keys, valid_keys=self.model.__table__.columns.keys())
         return cleaned_data
 
     def get_unary_expressions(self):
@@ -70,7 +77,7 @@ class ManagerFilter:
         order_by = []
 
         for key in ordering_cleaned:
-            clean_key = key.replace("-", "", 1)
+            clean_key = key[1:] if key[:1] == "-" else key
             order_item = getattr(self.model, clean_key).asc()
             if key.startswith("-"):
                 order_item = getattr(self.model, clean_key).desc()
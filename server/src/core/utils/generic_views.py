@@ -1,16 +1,30 @@
+import binascii
 import datetime
 import decimal
 import logging
-from urllib.parse import parse_qs, urlencode, urlparse
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from functools import cache, lru_cache
 from uuid import UUID
 
+import orjson
 from fastapi import Request, status
-from fastapi_pagination.ext.sqlalchemy import paginate
-from sqlalchemy import JSON, DateTime, Select, select, types
+from sqlalchemy import (
+    JSON,
+    DateTime,
+    ScalarResult,
+    Select,
+    and_,
+    func,
+    or_,
+    select,
+    tuple_,
+    types,
+)
 from sqlalchemy.dialects.postgresql import JSON as PJSON
-from sqlalchemy.orm import DeclarativeBase, Session
+from sqlalchemy.orm import DeclarativeBase, Session, selectinload
 
-from core.utils.exceptions import NoResultFound
+from core.settings import settings
+from core.utils.exceptions import CursorException, NoResultFound
 from core.utils.filters import ManagerFilter
 from core.utils.orm import Manager, QueryModel
 from core.utils.responses import PaginationParams, create_envelope_response
@@ -35,10 +49,30 @@ class Base(DeclarativeBase, QueryModel):
         return self.__str__()
 
 
+@cache
+def get_base_select(model) -> Select:
+    # Select is generative, every chained call returns a copy, so the cached statement is never mutated
+    return select(model)
+
+
+@lru_cache(maxsize=512)
+def _manage_filters_cached(model, filter_items: tuple) -> tuple[list, dict, list]:
+    return ManagerFilter(model=model, filters=dict(filter_items)).manage_filters()
+
+
 class BaseService:
     model: Base
     schema: BaseSchema = BaseSchema
     envelop_response = create_envelope_response
+    # Parsed filters are reused across requests with the same query string; disable for services
+    # whose filters must be parsed on every call
+    cache_filters: bool = True
+    # Relationships loaded in one extra SELECT ... IN per query instead of lazily per row; every
+    # schema field backed by a relationship must be listed here
+    eager_load: tuple[str, ...] = ()
+    # Build schemas with model_construct, skipping validation and type coercion; only enable when every
+    # schema field annotation matches the python type of its column (e.g. no Numeric column into a float)
+    trusted_schema: bool = False
 
     def __init__(self, session: Session):
         self.session = session
@@ -49,27 +83,56 @@ class BaseService:
         filters: dict | None = None,
         order_by: list | None = None,
     ):
-        if order_by is None:
-            order_by = []
-        if filters is None:
-            filters = {}
-        if unary_expressions is None:
-            unary_expressions = []
-
-        return select(self.model).where(*unary_expressions).filter_by(**filters).order_by(*order_by)
+        query = get_base_select(self.model)
+        if self.eager_load:
+            query = query.options(*(selectinload(getattr(self.model, r)) for r in self.eager_load))
+        if unary_expressions:
+            query = query.where(*unary_expressions)
+        if filters:
+            query = query.filter_by(**filters)
+        if order_by:
+            query = query.order_by(*order_by)
+        return query
+
+    def manage_filters(self, filters: dict) -> tuple[list, dict, list]:
+        if self.cache_filters:
+            filter_items = tuple(sorted(filters.items()))
+            try:
+                hash(filter_items)
+            except TypeError:
+                # Unhashable values (e.g. lists) can't be cache keys, parse them every time
+                pass
+            else:
+                unary_expressions, single_filters, order_by = _manage_filters_cached(self.model, filter_items)
+                return list(unary_expressions), dict(single_filters), list(order_by)
+
+        return ManagerFilter(model=self.model, filters=filters).manage_filters()
 
     def get_ordered_queryset(self, filters: dict):
-        unary_expressions, filters, order_by = ManagerFilter(model=self.model, filters=filters).manage_filters()
+        unary_expressions, filters, order_by = self.manage_filters(filters)
         return self.get_queryset(unary_expressions=unary_expressions, filters=filters, order_by=order_by)
 
     def get_query(self, filters: dict):
         return self.get_ordered_queryset(filters)
 
-    def get_objects(self, filters: dict) -> list:
-        query = self.get_query(filters)
-        return self.session.execute(query).scalars().all()
+    def get_objects(self, filters: dict) -> ScalarResult:
+        # Rows are streamed in batches and capped, so unpaginated lists never load an unbounded table at once
+        query = self.get_query(filters).limit(settings.MAX_LIST_SIZE)
+        return self.session.execute(query.execution_options(yield_per=settings.LIST_BATCH_SIZE)).scalars()
+
+    @classmethod
+    def get_schema_fields(cls) -> tuple[str, ...]:
+        # Schema fields backed by a model column, resolved once per service class
+        schema_fields = cls.__dict__.get("__schema_fields__")
+        if schema_fields is None:
+            column_names = cls.model.get_column_names()
+            schema_fields = tuple(name for name in cls.schema.model_fields if name in column_names)
+            cls.__schema_fields__ = schema_fields
+        return schema_fields
 
     def transform_to_schema(self, instance: Base):
+        if self.trusted_schema:
+            return self.schema.model_construct(**{name: getattr(instance, name) for name in self.get_schema_fields()})
         return self.schema(**instance.dict())
 
     def create_response(self, data, links=None, count=None):
@@ -86,29 +149,141 @@ class ObjectBaseService(BaseService):
         return instance
 
 
+def encode_cursor(ordering: str, instance: Base) -> str:
+    """Build the opaque cursor pointing right after ``instance`` for the given ordering key."""
+    field_name = ordering[1:] if ordering[:1] == "-" else ordering
+    payload = orjson.dumps([ordering, getattr(instance, field_name), instance.id], default=str)
+    return urlsafe_b64encode(payload).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> tuple[str, object, UUID]:
+    try:
+        ordering, value, last_id = orjson.loads(urlsafe_b64decode(cursor.encode("ascii")))
+        return ordering, value, UUID(last_id)
+    except (binascii.Error, orjson.JSONDecodeError, TypeError, ValueError) as e:
+        raise CursorException(cursor=cursor) from e
+
+
 class ListBaseService(BaseService):
-    def _generate_pagination_links(self, current_page: int, page_size: int, total: int, request: Request):
-        parsed_url = urlparse(str(request.url))
-        params = parse_qs(parsed_url.query)
-        total_pages = -(-total // page_size)
+    # Cursor pages still count the whole filtered set for the response count; disable to answer them
+    # with the page query alone (count is then None)
+    count_cursor_pages: bool = True
 
-        # Calculate next page link
+    def _generate_pagination_links(  # noqa: PLR0913
+        self,
+        current_page: int,
+        page_size: int,
+        total: int | None,
+        request: Request,
+        *,
+        has_next: bool | None = None,
+        last_item: Base | None = None,
+        ordering: str | None = None,
+    ):
+        if has_next is None:
+            # Everything fits in the first page, there is nowhere to link to
+            if total <= page_size and current_page <= 1:
+                return None, None
+            total_pages = (total + page_size - 1) // page_size
+            has_next = current_page < total_pages
+
+        # Calculate next page link, continuing right after the last item when the ordering allows a cursor
         next_page = None
-        if current_page < total_pages:
-            params["page"] = [current_page + 1]
-            next_page = parsed_url._replace(query=urlencode(params, doseq=True)).geturl()
-
-        # Calculate previous page link
+        if has_next and last_item is not None and ordering and self._get_cursor_column(ordering)[0] is not None:
+            next_page = str(
+                request.url.remove_query_params("page").include_query_params(
+                    cursor=encode_cursor(ordering, last_item)
+                )
+            )
+        elif has_next:
+            next_page = str(request.url.include_query_params(page=current_page + 1))
+
+        # Calculate previous page link, only offset pages know their position
         previous_page = None
-        if current_page > 1:
-            params["page"] = [current_page - 1]
-            previous_page = parsed_url._replace(query=urlencode(params, doseq=True)).geturl()
+        if "cursor" not in request.query_params and current_page > 1:
+            previous_page = str(request.url.include_query_params(page=current_page - 1))
 
         return next_page, previous_page
 
-    def _apply_pagination(self, query: Select, pagination_params: PaginationParams) -> dict:
-        page = paginate(self.session, query, pagination_params)
-        return {"items": page.items, "total": page.total}
+    def _count(self, query: Select) -> int:
+        count_query = select(func.count()).select_from(query.order_by(None).subquery())
+        return self.session.execute(count_query).scalar_one()
+
+    def _get_cursor_column(self, ordering: str):
+        # Only an ordering on a single column can be continued from a cursor
+        descending = ordering[:1] == "-"
+        field_name = ordering[1:] if descending else ordering
+        if "," in ordering or field_name not in self.model.__table__.columns:
+            return None, descending
+        return getattr(self.model, field_name), descending
+
+    def _keyset_order_by(self, column, *, descending: bool) -> tuple:
+        # NULLs go last in both directions, on every backend, so offset and cursor pages agree on their place
+        if descending:
+            return column.desc().nulls_last(), self.model.id.desc()
+        return column.asc().nulls_last(), self.model.id.asc()
+
+    def _apply_cursor_pagination(self, query: Select, pagination_params: PaginationParams, ordering: str) -> dict:
+        cursor_ordering, value, last_id = decode_cursor(pagination_params.cursor)
+        column, descending = self._get_cursor_column(ordering)
+        if cursor_ordering != ordering or column is None:
+            raise CursorException(cursor=pagination_params.cursor)
+
+        try:
+            python_type = column.type.python_type
+            if isinstance(value, str) and python_type is not str:
+                value = python_type.fromisoformat(value) if hasattr(python_type, "fromisoformat") else python_type(value)
+        except (NotImplementedError, TypeError, ValueError) as e:
+            raise CursorException(cursor=pagination_params.cursor) from e
+
+        total = self._count(query) if self.count_cursor_pages else None
+
+        # A row comparison against NULL is never true, so rows with a NULL key are matched explicitly
+        if value is None:
+            after_last = self.model.id < last_id if descending else self.model.id > last_id
+            condition = and_(column.is_(None), after_last)
+        else:
+            keyset = tuple_(column, self.model.id)
+            last_keyset = tuple_(value, last_id)
+            condition = or_(keyset < last_keyset if descending else keyset > last_keyset, column.is_(None))
+        query = query.where(condition).order_by(None).order_by(*self._keyset_order_by(column, descending=descending))
+
+        # Fetch one extra row to know whether there is a next page
+        items = self.session.execute(query.limit(pagination_params.size + 1)).scalars().all()
+        return {
+            "items": items[: pagination_params.size],
+            "total": total,
+            "has_next": len(items) > pagination_params.size,
+        }
+
+    def _apply_pagination(
+        self,
+        query: Select,
+        pagination_params: PaginationParams,
+        ordering: str = settings.DEFAULT_ORDER_FIELD,
+    ) -> dict:
+        if pagination_params.cursor:
+            return self._apply_cursor_pagination(query, pagination_params, ordering)
+
+        # Order like the cursor pages do, so the first cursor continues exactly after this page
+        column, descending = self._get_cursor_column(ordering)
+        if column is not None:
+            query = query.order_by(None).order_by(*self._keyset_order_by(column, descending=descending))
+        else:
+            query = query.order_by(self.model.id.desc() if descending else self.model.id.asc())
+
+        # The total travels with every row as a window function, so a single query returns both
+        offset = (pagination_params.page - 1) * pagination_params.size
+        page_query = query.add_columns(func.count().over().label("total_count"))
+        rows = self.session.execute(page_query.limit(pagination_params.size).offset(offset)).all()
+        if rows:
+            total = rows[0].total_count
+        elif offset:
+            # Past the last page there is no row to carry the total; count without the window function
+            total = self._count(query)
+        else:
+            total = 0
+        return {"items": [row[0] for row in rows], "total": total}
 
     def _build_response(self, next_link=None, prev_link=None, count=None, data=None):
         return {
@@ -119,7 +294,8 @@ class ListBaseService(BaseService):
 
     def _process_list(self, filters: dict, pagination_params: PaginationParams, request: Request) -> dict:
         query = self.get_query(filters)
-        page_info = self._apply_pagination(query, pagination_params)
+        ordering = filters.get("ordering") or settings.DEFAULT_ORDER_FIELD
+        page_info = self._apply_pagination(query, pagination_params, ordering)
 
         # Transform each item to its schema
         data = [self.transform_to_schema(item) for item in page_info["items"]]
@@ -131,13 +307,27 @@ class ListBaseService(BaseService):
             page_size=pagination_params.size,
             total=total,
             request=request,
+            has_next=page_info.get("has_next"),
+            last_item=page_info["items"][-1] if page_info["items"] else None,
+            ordering=ordering,
         )
         return self._build_response(next_link, prev_link, total, data)
 
     def _process_all(self, filters: dict):
         results = self.get_objects(filters)
         data = [self.transform_to_schema(item) for item in results]
-        return self._build_response(count=len(data), data=data)
+        count = len(data)
+        if count >= settings.MAX_LIST_SIZE:
+            # The list was capped by get_objects, report how many rows actually match
+            count = self._count(self.get_query(filters))
+            if count > len(data):
+                logger.warning(
+                    "Unpaginated %s list truncated to %s of %s rows",
+                    self.model.__tablename__,
+                    len(data),
+                    count,
+                )
+        return self._build_response(count=count, data=data)
 
     def list(self, filters: dict, pagination_params: PaginationParams, request: Request):
         if pagination_params.size <= 0:
@@ -155,22 +345,18 @@ class ListBaseService(BaseService):
 def validation_group(validation_function):
     def wrapper(self, *args, **kwargs):
         result_validation_function = validation_function(self, *args, **kwargs)
-        returns_validation_function_number = (
-            len(result_validation_function) if type(result_validation_function) == tuple else 1
-        )
-        if returns_validation_function_number <= 1:
+        if result_validation_function.__class__ is tuple:
+            errors, *data = result_validation_function
+            data = data[0] if len(data) == 1 else (data or None)
+        else:
             errors = result_validation_function
             data = None
-        elif returns_validation_function_number == 2:  # noqa: PLR2004
-            errors, data = result_validation_function
-        else:
-            errors, *data = result_validation_function
 
-        validations_success = not bool(len(errors))
-        self.request_errors["validations_errors"].update(errors)
-        self.request_errors["validations_success"] = (
-            self.request_errors.get("validations_success", True) and validations_success
-        )
+        validations_success = not errors
+        request_errors = self.request_errors
+        if errors:
+            request_errors["validations_errors"].update(errors)
+        request_errors["validations_success"] = request_errors.get("validations_success", True) and validations_success
         return validations_success, errors, data
 
     return wrapper
@@ -21,4 +21,4 @@ class LoggerConfig:
     )
         logger.configure(extra={"trace_id": None, "caller_id": None, "project_id": settings.PROJECT_ID})
         logger.remove()
-        logger.add(sys.stdout, colorize=True, format=_custom_format)
+        logger.add(sys.stdout, colorize=True, format=_custom_format, enqueue=settings.LOG_ENQUEUE)
@@ -8,18 +8,26 @@ T = TypeVar("T")
 
 
 class Manager(Generic[T]):
-    query = None
-    cls = None
+    # Stateless descriptor shared by every caller of Model.objects; each access gets its own builder
+    __slots__ = ()
 
-    def __init__(self: type[T]) -> None:
-        pass
+    def __get__(self, instance, owner) -> "_QueryBuilder[T]":
+        query: select = select(owner)
+        if hasattr(owner, "is_removed"):
+            query = query.where(owner.is_removed.is_(False))
+        return _QueryBuilder(owner, query)
 
-    def __get__(self, instance, owner):
-        self.cls: T = owner
-        self.query: select = select(self.cls)
-        if hasattr(self.cls, "is_removed"):
-            self.query = self.query.where(self.cls.is_removed.is_(False))
-        return self
+
+class _QueryBuilder(Generic[T]):
+    # Immutable: chained calls return a new builder, so concurrent callers never share a query
+    __slots__ = ("cls", "query")
+
+    def __init__(self, cls: type[T], query: select) -> None:
+        self.cls = cls
+        self.query = query
+
+    def _clone(self, query: select) -> "_QueryBuilder[T]":
+        return _QueryBuilder(self.cls, query)
 
     def scalars(self):
         return self.cls.session.execute(self.query).scalars()
@@ -31,64 +39,55 @@ class Manager(Generic[T]):
                 column = self.cls.id
         return column
 
-    def create(self: type[T], **kwargs: dict) -> T:
+    def create(self, **kwargs: dict) -> T:
         instance = self.cls(**kwargs)
         self.cls.session.add(instance)
         instance.save()
         return instance
 
     def get(self, *args, **kwargs) -> T:
-        self = self.filter(*args, **kwargs)
-        return self.scalars().one_or_none()
+        return self.filter(*args, **kwargs).scalars().one_or_none()
 
     def all(self) -> list[T]:
         return self.scalars().all()
 
     def first(self, column=None) -> T:
-        if column is not None:
-            self.query = self.query.order_by(column)
-        return self.scalars().first()
+        builder = self if column is None else self.order_by(column)
+        return builder.scalars().first()
 
     def last(self, column=None) -> T:
         if column is None:
             column = desc(self.cls.created)
-        self.query = self.query.order_by(column)
-        return self.scalars().first()
+        return self.order_by(column).scalars().first()
 
-    def filter(self, *args, **kwargs):
-        self.query = self.query.where(*args).filter_by(**kwargs)
-        return self
+    def filter(self, *args, **kwargs) -> "_QueryBuilder[T]":
+        return self._clone(self.query.where(*args).filter_by(**kwargs))
 
-    def deleted(self):
-        self.query: select = select(self.cls)
+    def deleted(self) -> "_QueryBuilder[T]":
+        query: select = select(self.cls)
         if hasattr(self.cls, "is_removed"):
-            self.query = self.query.where(self.cls.is_removed.is_(True))
-        return self
+            query = query.where(self.cls.is_removed.is_(True))
+        return self._clone(query)
 
     def count(self, column=None) -> int:
         column = self.get_default_column(column)
         query = self.query.with_only_columns(func.count(column))
         return self.cls.session.execute(query).scalar_one()
 
-    def exclude(self, *args, **kwargs):  # noqa: ARG002
-        self.query = self.query.where(func.not_(*args))
-        return self
+    def exclude(self, *args, **kwargs) -> "_QueryBuilder[T]":  # noqa: ARG002
+        return self._clone(self.query.where(func.not_(*args)))
 
-    def order_by(self, *args, **kwargs):  # noqa: ARG002
-        self.query = self.query.order_by(*args)
-        return self
+    def order_by(self, *args, **kwargs) -> "_QueryBuilder[T]":  # noqa: ARG002
+        return self._clone(self.query.order_by(*args))
 
-    def values(self, *columns):
-        self.query = self.query.with_only_columns(*columns)
-        return self
+    def values(self, *columns) -> "_QueryBuilder[T]":
+        return self._clone(self.query.with_only_columns(*columns))
 
-    def limit(self, limit):
-        self.query = self.query.limit(limit)
-        return self
+    def limit(self, limit) -> "_QueryBuilder[T]":
+        return self._clone(self.query.limit(limit))
 
-    def offset(self, offset):
-        self.query = self.query.offset(offset)
-        return self
+    def offset(self, offset) -> "_QueryBuilder[T]":
+        return self._clone(self.query.offset(offset))
 
     def delete(self, hard=False):
         results = self.scalars().all()
@@ -116,8 +115,20 @@ class Manager(Generic[T]):
 
 
 class QueryModel:
+    # Mixed into declarative models, which keep their own __dict__; empty slots add none here
+    __slots__ = ()
+
+    @classmethod
+    def get_column_names(cls) -> tuple[str, ...]:
+        # Looked up in the class own __dict__ so subclasses never reuse a parent's columns
+        column_names = cls.__dict__.get("__column_names__")
+        if column_names is None:
+            column_names = tuple(c.name for c in cls.__table__.columns)
+            cls.__column_names__ = column_names
+        return column_names
+
     def dict(self):
-        return {c.name: getattr(self, c.name) for c in self.__table__.columns}
+        return {name: getattr(self, name) for name in self.get_column_names()}
 
     def delete(self, hard=False) -> None:
         if hasattr(self, "is_removed"):
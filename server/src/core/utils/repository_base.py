@@ -1,14 +1,12 @@
 import uuid
 from abc import ABC, abstractmethod
-from datetime import datetime
 from typing import Any
 
-from pytz import timezone
-from sqlalchemy import and_
+from sqlalchemy import and_, delete, insert, update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
-from core.settings import log, settings
+from core.settings import log
 from core.utils.responses import get_current_date_time_to_app_standard
 
 
@@ -87,13 +85,16 @@ class RepositoryBase(ABC):
         result = False
         try:
             # Construct a dynamic update query
-            update_query = self.session.query(self.model).filter(self.model.id == id).update({field_name: new_value})
+            update_query = (
+                update(self.model).where(self.model.id == id).values({field_name: new_value}).returning(self.model.id)
+            )
+            updated_id = self.session.execute(update_query).first()
 
             # Commit the changes
             self.session.commit()
 
             # Return True if at least one row was affected
-            result = update_query > 0
+            result = updated_id is not None
 
         except Exception as e:
             # Roll back the changes in case of errors
@@ -210,17 +211,11 @@ class RepositoryBase(ABC):
         """
         new_record = None
         try:
-            current_time = datetime.now(timezone(settings.TIME_ZONE))
+            current_time = get_current_date_time_to_app_standard()
             new_record = self.model(**kwargs, created=current_time, updated=current_time, is_removed=False)
             self.session.add(new_record)
 
-            # Persist the record to the database
-            self.session.flush()
-
-            # Refresh the object to retrieve values generated by the database
-            self.session.refresh(new_record)
-
-            # Commit the record to the database
+            # Commit the record to the database, the commit flushes the INSERT itself
             self.session.commit()
         except SQLAlchemyError as e:
             # In case of an error, roll back the changes
@@ -230,6 +225,47 @@ class RepositoryBase(ABC):
             raise SQLAlchemyError(message_error)
         return new_record
 
+    def add_many(self, records: list[dict]) -> list:
+        """
+        Add several new records to the database in a single statement.
+
+        Parameters
+        ----------
+        records : list[dict]
+            One dictionary per record, whose keys should match the columns of the model.
+
+        Returns
+        -------
+        list
+            The newly created model instances, in the same order as ``records``.
+
+        Examples
+        --------
+        >>> repo = UserRepository(session)
+        >>> new_users = repo.add_many([{"name": "John"}, {"name": "Jane"}])
+        """
+        if not records:
+            return []
+
+        common_fields = self._get_common_fields()
+        try:
+            statement = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+            new_records = self.session.scalars(statement, [{**record, **common_fields} for record in records]).all()
+
+            # RETURNING already loaded every column; keep the records out of the session while committing so
+            # the commit doesn't expire them and reading them back costs no SELECT per record
+            for new_record in new_records:
+                self.session.expunge(new_record)
+            self.session.commit()
+            self.session.add_all(new_records)
+        except SQLAlchemyError as e:
+            # In case of an error, roll back the changes
+            self.session.rollback()
+            message_error = f"Failed to add new records: {e}"
+            log.error(message_error)
+            raise SQLAlchemyError(message_error)
+        return new_records
+
     def delete_by_id(self, id: uuid.UUID) -> bool:
         """
         Delete a record from the database by its unique identifier.
@@ -253,13 +289,14 @@ class RepositoryBase(ABC):
         result = False
         try:
             # Construct a delete query
-            delete_query = self.session.query(self.model).filter(self.model.id == id).delete()
+            delete_query = delete(self.model).where(self.model.id == id).returning(self.model.id)
+            deleted_id = self.session.execute(delete_query).first()
 
             # Commit the changes
             self.session.commit()
 
             # Return True if at least one row was affected
-            result = delete_query > 0
+            result = deleted_id is not None
 
         except Exception as e:
             # Roll back the changes in case of errors
@@ -6,7 +6,6 @@ from datetime import date, datetime
 from typing import Any
 
 from fastapi import Query, status
-from fastapi_pagination.default import OptionalParams
 
 # Third Party Stuff
 from pydantic import BaseModel, HttpUrl
@@ -51,8 +50,9 @@ def create_envelope_response(  # noqa: PLR0913
     status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR,
     successful: bool = False,  # noqa: FBT001
 ):
-    body = EnvelopeResponseBody(links=links, count=count, results=data).model_dump()
-    return EnvelopeResponse(
+    # Built from trusted server data, so neither model is validated; the response class serializes it
+    body = EnvelopeResponseBody.model_construct(links=links, count=count, results=data)
+    return EnvelopeResponse.model_construct(
         errors=None,
         body=body,
         message=message,
@@ -76,33 +76,44 @@ def create_simple_envelope_response(
     )
 
 
+APP_TIME_ZONE = timezone(settings.TIME_ZONE)
+UTC_TIME_ZONE = timezone(settings.TIME_ZONE_UTC)
+
+
 def get_current_date_time_to_app_standard() -> datetime:
-    return datetime.now(timezone(settings.TIME_ZONE))
+    return datetime.now(APP_TIME_ZONE)
 
 
 def get_current_date_time_utc() -> datetime:
-    return datetime.now(timezone(settings.TIME_ZONE_UTC))
+    return datetime.now(UTC_TIME_ZONE)
 
 
-class JSONEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, uuid.UUID):
-            return str(obj)
+_JSON_ENCODERS = {
+    uuid.UUID: str,
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+    decimal.Decimal: float,
+}
 
-        if isinstance(obj, datetime):
-            return obj.isoformat()
 
-        if isinstance(obj, date):
-            return obj.isoformat()
+class JSONEncoder(json.JSONEncoder):
+    def default(self, obj):
+        encoder = _JSON_ENCODERS.get(type(obj))
+        if encoder is not None:
+            return encoder(obj)
 
-        if isinstance(obj, decimal.Decimal):
-            return float(obj)
+        # Subclasses miss the exact type lookup
+        for type_, encoder in _JSON_ENCODERS.items():
+            if isinstance(obj, type_):
+                return encoder(obj)
 
         return json.JSONEncoder.default(self, obj)
 
 
-class PaginationParams(OptionalParams):
+class PaginationParams(BaseModel):
+    page: int | None = Query(None, ge=1, description="Page number")
     size: int | None = Query(None, ge=0, le=500, description="Page size")
+    cursor: str | None = Query(None, description="Opaque cursor of the last item of the previous page")
 
 
 def default_pagination_params(
@@ -114,8 +125,13 @@ def default_pagination_params(
         alias="page_size",
         description="Page size",
     ),
+    cursor: str | None = Query(
+        None,
+        alias="cursor",
+        description="Opaque cursor of the last item of the previous page",
+    ),
 ) -> PaginationParams:
-    return PaginationParams(page=page, size=page_size)
+    return PaginationParams(page=page, size=page_size, cursor=cursor)
 
 
 class FilterBaseSchema(BaseModel):
@@ -1,9 +1,7 @@
-from collections import defaultdict
-
 from fastapi import FastAPI, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.requests import Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from core.utils.responses import EnvelopeResponse
 
@@ -11,16 +9,16 @@ from core.utils.responses import EnvelopeResponse
 def validation_pydantic_field(app: FastAPI):
     @app.exception_handler(RequestValidationError)
     async def validate(_: Request, exc: Exception):
-        error_detail = defaultdict(list)
+        error_detail = {}
         for error in exc.errors():
             field = error["loc"][1] if "loc" in error else None
             error_msg = error["msg"]
-            error_detail[field].append(error_msg)
+            error_detail.setdefault(field, []).append(error_msg)
 
         response = EnvelopeResponse(
             errors=error_detail, body=None, status_code=status.HTTP_400_BAD_REQUEST, successful=False, message=error_msg
         )
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST,
-            content=dict(response),
+            content=response.model_dump(),
         )
@@ -1,19 +1,30 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import RedirectResponse
+from fastapi.responses import ORJSONResponse, RedirectResponse
 
 from api.routers import api_healthcheck_router, api_v1_router
 from core.middlewares.catcher import CatcherExceptionsMiddleware
 from core.middlewares.log_interceptor import LoggerMiddleware
 from core.settings import log, settings
-from core.settings.database import init_db, validate_db_conections
-from core.utils.environment import EnvironmentsTypes
+from core.settings.database import validate_db_conections
 from core.utils.logger import LoggerConfig
 from core.utils.validations import validation_pydantic_field
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await asyncio.to_thread(validate_db_conections)
+    yield
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     redirect_slashes=False,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 LoggerConfig.load_format()
@@ -39,8 +50,6 @@ def root():
     return RedirectResponse(url="/docs")
 
 
-#if EnvironmentsTypes.LOCAL.value[0] == settings.ENVIRONMENT:
-#    init_db()
-log.info(f"ENVIRONMENT: {settings.ENVIRONMENT}")
-validate_db_conections()
 validation_pydantic_field(app)
+
+log.info("ENVIRONMENT: %s", settings.ENVIRONMENT)
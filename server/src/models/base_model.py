@@ -18,4 +18,4 @@ class BaseModelClass(Base, QueryModel):
     is_removed = Column(Boolean, nullable=False, default=False)
 
     def as_dict(self):
-        return {c.name: getattr(self, c.name) for c in self.__table__.columns}
+        return {name: getattr(self, name) for name in self.get_column_names()}
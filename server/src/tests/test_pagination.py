@@ -0,0 +1,136 @@
+import unittest
+import uuid
+from typing import Annotated
+from unittest import mock
+
+import pytest
+from fastapi import Depends, FastAPI, Request
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Mapped, Session, mapped_column
+from sqlalchemy.pool import StaticPool
+
+from core.settings import settings
+from core.utils.exceptions import CursorException
+from core.utils.generic_views import Base, ListBaseService, decode_cursor, encode_cursor
+from core.utils.responses import PaginationParams, default_pagination_params
+
+
+class PaginatedItem(Base):
+    __tablename__ = "tests_paginated_item"
+
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    n: Mapped[int | None]
+
+
+class PaginatedItemSchema(BaseModel):
+    id: uuid.UUID
+    n: int | None
+
+
+class PaginatedItemService(ListBaseService):
+    model = PaginatedItem
+    schema = PaginatedItemSchema
+
+
+class UncountedPaginatedItemService(PaginatedItemService):
+    count_cursor_pages = False
+
+
+class CursorTestCase(unittest.TestCase):
+    def test_round_trip(self):
+        item = PaginatedItem(id=uuid.uuid4(), n=7)
+        self.assertEqual(decode_cursor(encode_cursor("-n", item)), ("-n", 7, item.id))
+
+    def test_round_trip_null_value(self):
+        item = PaginatedItem(id=uuid.uuid4(), n=None)
+        self.assertEqual(decode_cursor(encode_cursor("n", item)), ("n", None, item.id))
+
+    def test_invalid_cursor(self):
+        for cursor in ("not a cursor", encode_cursor("n", PaginatedItem(id="nope", n=1))):
+            with self.subTest(cursor=cursor), pytest.raises(CursorException):
+                decode_cursor(cursor)
+
+
+class CursorPaginationTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        Base.metadata.create_all(engine, tables=[PaginatedItem.__table__])
+        cls.session = Session(engine)
+        cls.session.add_all(PaginatedItem(n=n) for n in (3, None, 1, None, 2, None, None))
+        cls.session.commit()
+
+        app = FastAPI()
+
+        @app.get("/items")
+        def items(
+            request: Request,
+            ordering: str,
+            pagination_params: Annotated[PaginationParams, Depends(default_pagination_params)],
+        ):
+            return PaginatedItemService(cls.session).list({"ordering": ordering}, pagination_params, request)
+
+        @app.get("/uncounted-items")
+        def uncounted_items(
+            request: Request,
+            ordering: str,
+            pagination_params: Annotated[PaginationParams, Depends(default_pagination_params)],
+        ):
+            return UncountedPaginatedItemService(cls.session).list({"ordering": ordering}, pagination_params, request)
+
+        cls.client = TestClient(app)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.session.close()
+
+    def follow_next_links(self, ordering: str) -> list:
+        url = f"/items?page_size=2&ordering={ordering}"
+        values = []
+        while url:
+            body = self.client.get(url).json()["body"]
+            self.assertEqual(body["count"], 7)
+            values += [item["n"] for item in body["results"]]
+            url = body["links"]["next"]
+        return values
+
+    def test_nullable_column_ascending(self):
+        self.assertEqual(self.follow_next_links("n"), [1, 2, 3, None, None, None, None])
+
+    def test_nullable_column_descending(self):
+        self.assertEqual(self.follow_next_links("-n"), [3, 2, 1, None, None, None, None])
+
+    def test_next_link_without_cursor_column(self):
+        for ordering in ("-", "n,-id"):
+            with self.subTest(ordering=ordering):
+                url = f"/items?page_size=3&ordering={ordering}"
+                ids = []
+                while url:
+                    response = self.client.get(url)
+                    self.assertEqual(response.status_code, 200)
+                    body = response.json()["body"]
+                    ids += [item["id"] for item in body["results"]]
+                    url = body["links"]["next"]
+                    if url:
+                        self.assertNotIn("cursor=", url)
+                self.assertEqual(len(set(ids)), 7)
+
+    def test_next_link_uses_cursor(self):
+        body = self.client.get("/items?page_size=2&ordering=n").json()["body"]
+        self.assertIn("cursor=", body["links"]["next"])
+
+    def test_cursor_page_without_count(self):
+        first_page = self.client.get("/uncounted-items?page_size=2&ordering=n").json()["body"]
+        self.assertEqual(first_page["count"], 7)
+        next_page = self.client.get(first_page["links"]["next"]).json()["body"]
+        self.assertIsNone(next_page["count"])
+        self.assertEqual([item["n"] for item in next_page["results"]], [3, None])
+        self.assertIsNotNone(next_page["links"]["next"])
+
+    def test_unpaginated_list_reports_real_count(self):
+        with mock.patch.object(settings, "MAX_LIST_SIZE", 3), self.assertLogs("core.utils.generic_views", "WARNING"):
+            body = self.client.get("/items?page_size=0&ordering=n").json()["body"]
+        self.assertEqual(len(body["results"]), 3)
+        self.assertEqual(body["count"], 7)